@@ -51,21 +51,23 @@ Tag = namedtuple('Tag', 'block_type_name block_name start end')
 
 _NAME_PATTERN = r'[A-Za-z_][A-Za-z_0-9]*'
 
-COMMENT_START_PATTERN = regex(r'(?:(?P<comment_start>(\s*\{\#)))')
-COMMENT_END_PATTERN = regex(r'(.*?)(\s*\#\})')
-RAW_START_PATTERN = regex(
-    r'(?:\s*\{\%\-|\{\%)\s*(?P<raw_start>(raw))\s*(?:\-\%\}\s*|\%\})'
-)
-EXPR_START_PATTERN = regex(r'(?P<expr_start>(\{\{\s*))')
-EXPR_END_PATTERN = regex(r'(?P<expr_end>(\s*\}\}))')
+_COMMENT_START = r'(?:(?P<comment_start>(\s*\{\#)))'
+_EXPR_START = r'(?P<expr_start>(\{\{\s*))'
+_EXPR_END = r'(?P<expr_end>(\s*\}\}))'
+_TAG_CLOSE = r'(?:(?P<tag_close>(\-\%\}\s*|\%\})))'
+_QUOTE_START = r'''(?P<quote>(['"]))'''
 
-BLOCK_START_PATTERN = regex(''.join((
+_BLOCK_START = ''.join((
     r'(?:\s*\{\%\-|\{\%)\s*',
     r'(?P<block_type_name>({}))'.format(_NAME_PATTERN),
     # some blocks have a 'block name'.
     r'(?:\s+(?P<block_name>({})))?'.format(_NAME_PATTERN),
-)))
+))
 
+COMMENT_END_PATTERN = regex(r'(.*?)(\s*\#\})')
+RAW_START_PATTERN = regex(
+    r'(?:\s*\{\%\-|\{\%)\s*(?P<raw_start>(raw))\s*(?:\-\%\}\s*|\%\})'
+)
 
 RAW_BLOCK_PATTERN = regex(''.join((
     r'(?:\s*\{\%\-|\{\%)\s*raw\s*(?:\-\%\}\s*|\%\})',
@@ -73,8 +75,6 @@ RAW_BLOCK_PATTERN = regex(''.join((
     r'(?:\s*\{\%\-|\{\%)\s*endraw\s*(?:\-\%\}\s*|\%\})',
 )))
 
-TAG_CLOSE_PATTERN = regex(r'(?:(?P<tag_close>(\-\%\}\s*|\%\})))')
-
 # stolen from jinja's lexer. Note that we've consumed all prefix whitespace by
 # the time we want to use this.
 STRING_PATTERN = regex(
@@ -82,7 +82,17 @@ STRING_PATTERN = regex(
     r'"([^"\\]*(?:\\.[^"\\]*)*)"))'
 )
 
-QUOTE_START_PATTERN = regex(r'''(?P<quote>(['"]))''')
+# the scanner loops each want "whichever of these tokens comes first". A
+# single alternation finds that in one pass over the data instead of one
+# search per candidate pattern. No alternative can start inside another's
+# matched span (the spans only ever contain whitespace, the token itself,
+# and identifiers), so the leftmost match here is the same tag the separate
+# searches used to pick.
+TAG_START_PATTERN = regex('|'.join((
+    _BLOCK_START, _COMMENT_START, _EXPR_START
+)))
+EXPR_END_OR_QUOTE_PATTERN = regex('|'.join((_EXPR_END, _QUOTE_START)))
+TAG_CLOSE_OR_QUOTE_PATTERN = regex('|'.join((_TAG_CLOSE, _QUOTE_START)))
 
 
 class TagIterator:
@@ -116,24 +126,8 @@ class TagIterator:
     def _match(self, pattern):
         return pattern.match(self.data, self.pos)
 
-    def _first_match(self, *patterns, **kwargs):
-        matches = []
-        for pattern in patterns:
-            # default to 'search', but sometimes we want to 'match'.
-            if kwargs.get('method', 'search') == 'search':
-                match = self._search(pattern)
-            else:
-                match = self._match(pattern)
-            if match:
-                matches.append(match)
-        if not matches:
-            return None
-        # if there are multiple matches, pick the least greedy match
-        # TODO: do I need to account for m.start(), or is this ok?
-        return min(matches, key=lambda m: m.end())
-
-    def _expect_match(self, expected_name, *patterns, **kwargs):
-        match = self._first_match(*patterns, **kwargs)
+    def _expect_match(self, expected_name, pattern):
+        match = self._search(pattern)
         if match is None:
             msg = 'unexpected EOF, expected {}, got "{}"'.format(
                 expected_name, self.data[self.pos:]
@@ -156,10 +150,8 @@ class TagIterator:
         """
         self.advance(match.end())
         while True:
-            match = self._expect_match('}}',
-                                       EXPR_END_PATTERN,
-                                       QUOTE_START_PATTERN)
-            if match.groupdict().get('expr_end') is not None:
+            match = self._expect_match('}}', EXPR_END_OR_QUOTE_PATTERN)
+            if match.group('expr_end') is not None:
                 break
             else:
                 # it's a quote. we haven't advanced for this match yet, so
@@ -188,12 +180,10 @@ class TagIterator:
         """
         while True:
             end_match = self._expect_match(
-                'tag close ("%}")',
-                QUOTE_START_PATTERN,
-                TAG_CLOSE_PATTERN
+                'tag close ("%}")', TAG_CLOSE_OR_QUOTE_PATTERN
             )
             self.advance(end_match.end())
-            if end_match.groupdict().get('tag_close') is not None:
+            if end_match.group('tag_close') is not None:
                 return
             # must be a string. Rewind to its start and advance past it.
             self.rewind()
@@ -218,11 +208,10 @@ class TagIterator:
 
         But the key here is that it's always going to be `{% mytag`!
         """
-        groups = match.groupdict()
         # always a value
-        block_type_name = groups['block_type_name']
+        block_type_name = match.group('block_type_name')
         # might be None
-        block_name = groups.get('block_name')
+        block_name = match.group('block_name')
         start_pos = self.pos
         if block_type_name == 'raw':
             match = self._expect_match('{% raw %}...{% endraw %}',
@@ -240,21 +229,18 @@ class TagIterator:
 
     def find_tags(self):
         while True:
-            match = self._first_match(
-                BLOCK_START_PATTERN,
-                COMMENT_START_PATTERN,
-                EXPR_START_PATTERN
-            )
+            match = self._search(TAG_START_PATTERN)
             if match is None:
                 break
 
             self.advance(match.start())
             # start = self.pos
 
-            groups = match.groupdict()
-            comment_start = groups.get('comment_start')
-            expr_start = groups.get('expr_start')
-            block_type_name = groups.get('block_type_name')
+            # pull the named groups directly rather than building the full
+            # groupdict for every tag in the file
+            comment_start = match.group('comment_start')
+            expr_start = match.group('expr_start')
+            block_type_name = match.group('block_type_name')
 
             if comment_start is not None:
                 self.handle_comment(match)
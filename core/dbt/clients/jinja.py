@@ -1,4 +1,5 @@
 import codecs
+import functools
 import linecache
 import os
 import re
@@ -460,7 +461,7 @@ TEXT_FILTERS: Dict[str, Callable[[Any], Any]] = {
 }
 
 
-def get_environment(
+def _build_environment(
     node=None,
     capture_macros: bool = False,
     native: bool = False,
@@ -490,6 +491,27 @@ def get_environment(
     return env
 
 
+_ENV_CACHE: Dict[bool, jinja2.Environment] = {}
+
+
+def get_environment(
+    node=None,
+    capture_macros: bool = False,
+    native: bool = False,
+) -> jinja2.Environment:
+    # an environment built with capture_macros has an undefined class that
+    # captures the node, so only the plain environments can be shared. Those
+    # are never mutated after construction (globals travel on the templates,
+    # not the environment), so one per code-generator kind is enough.
+    if capture_macros:
+        return _build_environment(node, capture_macros, native)
+
+    env = _ENV_CACHE.get(native)
+    if env is None:
+        env = _ENV_CACHE[native] = _build_environment(native=native)
+    return env
+
+
 @contextmanager
 def catch_jinja(node=None) -> Iterator[None]:
     try:
@@ -509,6 +531,16 @@ def parse(string):
         return get_environment().parse(str(string))
 
 
+@functools.lru_cache(maxsize=4096)
+def _compiled_template_code(source: str, native: bool):
+    # the compiled code object depends only on the source and on which code
+    # generator produced it - not on the globals or undefined handling of any
+    # particular call - so identical sources (hooks, name macros, re-rendered
+    # models) can share one compilation. Compilation errors are not cached;
+    # lru_cache re-runs the call if it raised.
+    return get_environment(native=native).compile(source)
+
+
 def get_template(
     string: str,
     ctx: Dict[str, Any],
@@ -520,7 +552,10 @@ def get_template(
         env = get_environment(node, capture_macros, native=native)
 
         template_source = str(string)
-        return env.from_string(template_source, globals=ctx)
+        code = _compiled_template_code(template_source, native)
+        return env.template_class.from_code(
+            env, code, env.make_globals(ctx), None
+        )
 
 
 def render_template(template, ctx: Dict[str, Any], node=None) -> str:
@@ -555,14 +590,13 @@ def get_rendered(
     capture_macros: bool = False,
     native: bool = False,
 ) -> str:
-    # performance optimization: if there are no jinja control characters in the
-    # string, we can just return the input. Fall back to jinja if the type is
-    # not a string or if native rendering is enabled (so '1' -> 1, etc...)
-    # If this is desirable in the native env as well, we could handle the
-    # native=True case by passing the input string to ast.literal_eval, like
-    # the native renderer does.
+    # performance optimization: if there are no jinja control characters in
+    # the string, we can just return the input. This holds in the native
+    # environment too: quoted_native_concat only literal_evals values marked
+    # by the as_bool/as_number/as_native filters, so a template that is pure
+    # text renders to the same string. Non-string inputs still go through
+    # jinja, which stringifies them.
     if (
-        not native and
         isinstance(string, str) and
         _HAS_RENDER_CHARS_PAT.search(string) is None
     ):
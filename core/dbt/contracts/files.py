@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import os
 from dataclasses import dataclass, field
@@ -85,9 +86,16 @@ class FileHash(JsonSchemaMixin):
         the utf-8 encoding of the contents given, because dbt only reads files
         as utf-8.
         """
-        data = contents.encode('utf-8')
-        checksum = hashlib.new(name, data).hexdigest()
-        return cls(name=name, checksum=checksum)
+        return cls(name=name, checksum=_checksum_contents(contents, name))
+
+
+# hashing is deterministic, so files that are read (or compared via
+# FileHash.compare) more than once per run only pay for the digest once. The
+# cache keys reference content strings that the manifest holds anyway, so
+# this does not meaningfully grow memory use.
+@functools.lru_cache(maxsize=4096)
+def _checksum_contents(contents: str, name: str) -> str:
+    return hashlib.new(name, contents.encode('utf-8')).hexdigest()
 
 
 @dataclass
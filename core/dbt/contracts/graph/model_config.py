@@ -1,8 +1,9 @@
+import sys
 from dataclasses import field, Field, dataclass
 from enum import Enum
 from typing import (
     Any, List, Optional, Dict, MutableMapping, Union, Type, NewType, Tuple,
-    TypeVar, Callable
+    TypeVar, Callable, ClassVar
 )
 
 # TODO: patch+upgrade hologram to avoid this jsonschema import
@@ -224,6 +225,16 @@ class BaseConfig(
         else:
             del self._extra[key]
 
+    @classmethod
+    def _get_fields(cls) -> List[Tuple[Field, str]]:
+        # hologram resolves type hints on every call, but the field set is
+        # fixed once the class exists, so compute it once per class.
+        cached = cls.__dict__.get('_fields_cache')
+        if cached is None:
+            cached = super()._get_fields()
+            cls._fields_cache = cached
+        return cached
+
     def _content_iterator(self, include_condition: Callable[[Field], bool]):
         seen = set()
         for fld, _ in self._get_fields():
@@ -411,6 +422,15 @@ class NodeConfig(BaseConfig):
         for key in hooks.ModelHookType:
             if key in data:
                 data[key] = [hooks.get_hook_dict(h) for h in data[key]]
+        # a handful of values ('view', 'table', 'timestamp', ...) account for
+        # nearly every materialized/strategy string in a manifest. Interning
+        # them collapses the copies that come out of yaml/json parsing and
+        # makes the frequent equality checks against literals pointer
+        # comparisons.
+        for key in ('materialized', 'strategy'):
+            value = data.get(key)
+            if type(value) is str:
+                data[key] = sys.intern(value)
         return super().from_dict(data, validate=validate)
 
     @classmethod
@@ -455,12 +475,18 @@ class SnapshotWrapper(JsonSchemaMixin):
     """
     config: SnapshotVariants  # mypy: ignore
 
+    # validate() runs once per snapshot during parsing; the schema is cached
+    # in hologram but the compiled validator was rebuilt on every call, so
+    # keep one here. Class-level, not module-level: the schema for this class
+    # never changes within a process.
+    _validator: ClassVar[Optional[jsonschema.Draft7Validator]] = None
+
     @classmethod
     def validate(cls, data: Any):
-        schema = _validate_schema(cls)
-        validator = jsonschema.Draft7Validator(schema)
+        if cls._validator is None:
+            cls._validator = jsonschema.Draft7Validator(_validate_schema(cls))
         error = jsonschema.exceptions.best_match(
-            validator.iter_errors(data),
+            cls._validator.iter_errors(data),
             key=_relevance_without_strategy,
         )
         if error is not None:
@@ -25,10 +25,33 @@ def list_str() -> List[str]:
     return []
 
 
+def _restore_fields(cls, values):
+    """Rebuild a pickled dataclass from its tuple of field values. Must stay
+    module-level so pickle can find it by name.
+    """
+    self = cls.__new__(cls)
+    # object.__setattr__ so frozen dataclasses restore too
+    for fld, value in zip(dataclasses.fields(cls), values):
+        object.__setattr__(self, fld.name, value)
+    return self
+
+
 class Replaceable:
     def replace(self, **kwargs):
         return dataclasses.replace(self, **kwargs)
 
+    def __reduce__(self):
+        # pickle as a tuple of field values rather than the default
+        # per-instance attribute dict. The partial_parse.pickle file holds
+        # every parsed node, so dropping the repeated attribute names and
+        # dict overhead meaningfully shrinks it and speeds the reload; a
+        # file written by a different dbt version is discarded by the
+        # version check before its contents are trusted.
+        return _restore_fields, (
+            type(self),
+            tuple(getattr(self, f.name) for f in dataclasses.fields(self)),
+        )
+
 
 class Mergeable(Replaceable):
     def merged(self, *args):
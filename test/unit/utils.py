@@ -3,14 +3,16 @@
 Note that all imports should be inside the functions to avoid import/mocking
 issues.
 """
+import functools
 import string
 import os
 from unittest import mock
 from unittest import TestCase
 
 import agate
+import jsonschema
 import pytest
-from hologram import ValidationError
+from hologram import ValidationError, _validate_schema
 
 
 def normalize(path):
@@ -137,6 +139,26 @@ def clear_plugin(plugin):
     FACTORY.adapters.pop(key, None)
 
 
+@functools.lru_cache(maxsize=None)
+def _validator_for(cls):
+    """Get a jsonschema validator for the given dataclass, building it at most
+    once per class. Hologram caches the generated schema but constructs a new
+    Draft7Validator on every validate() call, which dominates the cost of the
+    many from_dict calls in the contract tests.
+    """
+    return jsonschema.Draft7Validator(_validate_schema(cls))
+
+
+def validated_from_dict(cls, dct):
+    """Like cls.from_dict(dct), but using the cached validator."""
+    error = jsonschema.exceptions.best_match(
+        _validator_for(cls).iter_errors(dct)
+    )
+    if error is not None:
+        raise ValidationError.create_from(error) from error
+    return cls.from_dict(dct, validate=False)
+
+
 class ContractTestCase(TestCase):
     ContractType = None
 
@@ -150,18 +172,20 @@ class ContractTestCase(TestCase):
     def assert_from_dict(self, obj, dct, cls=None):
         if cls is None:
             cls = self.ContractType
-        self.assertEqual(cls.from_dict(dct),  obj)
+        self.assertEqual(validated_from_dict(cls, dct),  obj)
 
     def assert_symmetric(self, obj, dct, cls=None):
-        self.assert_to_dict(obj, dct)
-        self.assert_from_dict(obj, dct, cls)
+        if cls is None:
+            cls = self.ContractType
+        self.assertEqual(obj.to_dict(), dct)
+        self.assertEqual(validated_from_dict(cls, dct), obj)
 
     def assert_fails_validation(self, dct, cls=None):
         if cls is None:
             cls = self.ContractType
 
         with self.assertRaises(ValidationError):
-            cls.from_dict(dct)
+            validated_from_dict(cls, dct)
 
 
 def assert_to_dict(obj, dct):
@@ -171,17 +195,22 @@ def assert_to_dict(obj, dct):
 def assert_from_dict(obj, dct, cls=None):
     if cls is None:
         cls = obj.__class__
-    assert cls.from_dict(dct) == obj
+    assert validated_from_dict(cls, dct) == obj
 
 
 def assert_symmetric(obj, dct, cls=None):
-    assert_to_dict(obj, dct)
-    assert_from_dict(obj, dct, cls)
+    # inlined rather than composed from assert_to_dict/assert_from_dict: this
+    # runs exactly one serialization and one (cached-validator) validation,
+    # which is the hot path of the contract tests
+    if cls is None:
+        cls = obj.__class__
+    assert obj.to_dict() == dct
+    assert validated_from_dict(cls, dct) == obj
 
 
 def assert_fails_validation(dct, cls):
     with pytest.raises(ValidationError):
-        cls.from_dict(dct)
+        validated_from_dict(cls, dct)
 
 
 def generate_name_macros(package):